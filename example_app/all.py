@@ -1,20 +1,26 @@
+"""
+PySide6 Multi-Tab Example Application - single-file version
+
+The original all-in-one form of the example, kept as a plain reference.
+The maintained application is main.py plus the per-tab modules in this
+directory; performance work (lazy tab construction, deferred QtWebEngine
+and QtMultimedia imports, chart and image viewer optimizations) is done
+there and intentionally not mirrored here.
+"""
+
 import sys
 import random
 import os
 from PySide6.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, 
                                QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, 
-                               QLabel, QLineEdit, QTextEdit, QSlider, QProgressBar,
+                               QLabel, QLineEdit, QTextEdit, QSlider,
                                QCheckBox, QRadioButton, QComboBox, QSpinBox,
                                QListWidget, QTableWidget, QTableWidgetItem,
                                QGroupBox, QButtonGroup, QMessageBox, QFileDialog,
-                               QColorDialog, QFontDialog, QCalendarWidget,
-                               QTreeWidget, QTreeWidgetItem, QSplitter, QScrollArea,
-                               QTextBrowser, QPlainTextEdit, QToolBar)
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QUrl
-from PySide6.QtGui import (QPixmap, QPainter, QPen, QColor, QFont, QAction, 
-                           QKeySequence, QDragEnterEvent, QDropEvent)
-import math
-import time
+                               QColorDialog, QFontDialog, QSplitter, QScrollArea,
+                               QTextBrowser, QPlainTextEdit)
+from PySide6.QtCore import Qt, QUrl
+from PySide6.QtGui import QPixmap, QPainter, QPen, QDragEnterEvent, QDropEvent
 
 # Try to import optional components
 try:
@@ -10,12 +10,39 @@ from PySide6.QtCore import Qt
 class CalculatorTab(QWidget):
     """Simple calculator tab with basic arithmetic operations"""
     
+    # Button definitions: (text, row, col, row_span, col_span)
+    BUTTON_LAYOUT = (
+        ('C', 0, 0, 1, 1), ('±', 0, 1, 1, 1), ('%', 0, 2, 1, 1), ('÷', 0, 3, 1, 1),
+        ('7', 1, 0, 1, 1), ('8', 1, 1, 1, 1), ('9', 1, 2, 1, 1), ('×', 1, 3, 1, 1),
+        ('4', 2, 0, 1, 1), ('5', 2, 1, 1, 1), ('6', 2, 2, 1, 1), ('-', 2, 3, 1, 1),
+        ('1', 3, 0, 1, 1), ('2', 3, 1, 1, 1), ('3', 3, 2, 1, 1), ('+', 3, 3, 1, 1),
+        ('0', 4, 0, 1, 2), ('.', 4, 2, 1, 1), ('=', 4, 3, 1, 1)
+    )
+    
+    # One stylesheet for the whole keypad, selected by each button's role
+    BUTTON_STYLE = """
+        QPushButton[role="operator"] { background-color: #ff9500; color: white; font-weight: bold; }
+        QPushButton[role="function"] { background-color: #a6a6a6; color: black; font-weight: bold; }
+        QPushButton[role="digit"] { background-color: #333333; color: white; font-weight: bold; }
+    """
+    
     def __init__(self):
         super().__init__()
         self.current_input = ""
         self.result = 0
         self.operator = ""
         self.waiting_for_operand = False
+        
+        # Key label -> handler, so a click is one dict lookup
+        self._key_handlers = dict.fromkeys("0123456789.", self.handle_digit_or_decimal)
+        self._key_handlers.update(dict.fromkeys("+-×÷", self.handle_operator))
+        self._key_handlers.update({
+            '=': lambda _text: self.calculate(),
+            'C': lambda _text: self.clear(),
+            '±': lambda _text: self.toggle_sign(),
+            '%': lambda _text: self.handle_percentage(),
+        })
+        
         self.init_ui()
         
     def init_ui(self):
@@ -33,56 +60,37 @@ class CalculatorTab(QWidget):
         # Buttons
         buttons_layout = QGridLayout()
         
-        # Button definitions: (text, row, col, row_span, col_span)
-        buttons = [
-            ('C', 0, 0), ('±', 0, 1), ('%', 0, 2), ('÷', 0, 3),
-            ('7', 1, 0), ('8', 1, 1), ('9', 1, 2), ('×', 1, 3),
-            ('4', 2, 0), ('5', 2, 1), ('6', 2, 2), ('-', 2, 3),
-            ('1', 3, 0), ('2', 3, 1), ('3', 3, 2), ('+', 3, 3),
-            ('0', 4, 0, 1, 2), ('.', 4, 2), ('=', 4, 3)
-        ]
-        
-        for button_info in buttons:
-            text = button_info[0]
-            row = button_info[1]
-            col = button_info[2]
-            row_span = button_info[3] if len(button_info) > 3 else 1
-            col_span = button_info[4] if len(button_info) > 4 else 1
-            
+        for text, row, col, row_span, col_span in self.BUTTON_LAYOUT:
             btn = QPushButton(text)
-            btn.clicked.connect(lambda checked, t=text: self.button_clicked(t))
+            btn.clicked.connect(self.on_button_clicked)
             btn.setMinimumHeight(50)
             
             # Style operator buttons differently
             if text in ['+', '-', '×', '÷', '=']:
-                btn.setStyleSheet("background-color: #ff9500; color: white; font-weight: bold;")
+                btn.setProperty("role", "operator")
             elif text in ['C', '±', '%']:
-                btn.setStyleSheet("background-color: #a6a6a6; color: black; font-weight: bold;")
+                btn.setProperty("role", "function")
             else:
-                btn.setStyleSheet("background-color: #333333; color: white; font-weight: bold;")
+                btn.setProperty("role", "digit")
                 
             buttons_layout.addWidget(btn, row, col, row_span, col_span)
         
         buttons_widget = QWidget()
+        buttons_widget.setStyleSheet(self.BUTTON_STYLE)
         buttons_widget.setLayout(buttons_layout)
         layout.addWidget(buttons_widget)
         
         self.setLayout(layout)
         
+    def on_button_clicked(self):
+        """Shared slot for all buttons; the sender's label identifies the key"""
+        self.button_clicked(self.sender().text())
+        
     def button_clicked(self, text):
         """Handle button click events"""
-        if text.isdigit() or text == '.':
-            self.handle_digit_or_decimal(text)
-        elif text in ['+', '-', '×', '÷']:
-            self.handle_operator(text)
-        elif text == '=':
-            self.calculate()
-        elif text == 'C':
-            self.clear()
-        elif text == '±':
-            self.toggle_sign()
-        elif text == '%':
-            self.handle_percentage()
+        handler = self._key_handlers.get(text)
+        if handler:
+            handler(text)
             
     def handle_digit_or_decimal(self, text):
         """Handle digit and decimal point input"""
@@ -128,10 +136,7 @@ class CalculatorTab(QWidget):
                         return
                         
                 # Format result to remove unnecessary decimal places
-                if self.result == int(self.result):
-                    self.current_input = str(int(self.result))
-                else:
-                    self.current_input = f"{self.result:.10g}"
+                self.current_input = self.format_number(self.result)
                     
                 self.display.setText(self.current_input)
                 self.operator = ""
@@ -144,6 +149,15 @@ class CalculatorTab(QWidget):
                 QMessageBox.warning(self, "Error", f"Calculation error: {str(e)}")
                 self.clear()
                 
+    def format_number(self, value):
+        """Format a value for display, keeping whole numbers exact"""
+        # int() raises for inf/nan, so those still reach the error dialogs,
+        # and it turns -0.0 into 0
+        whole = int(value)
+        if value == whole:
+            return str(whole)
+        return format(value, ".10g")
+        
     def clear(self):
         """Clear all values and reset calculator"""
         self.current_input = ""
@@ -166,10 +180,7 @@ class CalculatorTab(QWidget):
         if self.current_input:
             try:
                 value = float(self.current_input) / 100
-                if value == int(value):
-                    self.current_input = str(int(value))
-                else:
-                    self.current_input = f"{value:.10g}"
+                self.current_input = self.format_number(value)
                 self.display.setText(self.current_input)
             except ValueError:
                 QMessageBox.warning(self, "Error", "Invalid number for percentage!")
\ No newline at end of file
@@ -7,16 +7,25 @@ import math
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QLabel, QComboBox, QTableWidget, QTableWidgetItem,
                                QMessageBox, QSpinBox, QLineEdit)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QPainter, QPen, QColor, QFont
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPixmap, QPainter, QPen, QColor, QFont, QStaticText, QPolygonF
 
 
 class DataVisualizationTab(QWidget):
     """Data visualization tab with interactive charts"""
     
+    # Series colors shared by every chart
+    CHART_COLORS = tuple(QColor(c) for c in (
+        "#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7",
+        "#DDA0DD", "#98D8C8", "#F7DC6F", "#BB8FCE"))
+    SCATTER_COLORS = CHART_COLORS[:5]
+    
     def __init__(self):
         super().__init__()
         self.data = []
+        self._max_value = 0
+        self._label_static = {}
+        self._dirty = False
         self.init_ui()
         
     def init_ui(self):
@@ -83,6 +92,9 @@ class DataVisualizationTab(QWidget):
         self.chart_label.setStyleSheet("border: 1px solid #333; background-color: white;")
         self.chart_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
+        # Chart buffer reused for every redraw
+        self._chart_pixmap = QPixmap(680, 430)
+        
         layout.addWidget(self.chart_label)
         
         # Data table
@@ -117,6 +129,7 @@ class DataVisualizationTab(QWidget):
             ("Development", 70)
         ]
         self.data.extend(sample_data)
+        self._max_value = max(self._max_value, *(value for _, value in sample_data))
         self.update_table()
         
     def add_random_data(self):
@@ -131,6 +144,7 @@ class DataVisualizationTab(QWidget):
                 label = random.choice(available_labels)
                 value = random.randint(10, 100)
                 self.data.append((label, value))
+                self._max_value = max(self._max_value, value)
                 self.update_table()
                 self.update_chart()
         else:
@@ -159,6 +173,7 @@ class DataVisualizationTab(QWidget):
             return
             
         self.data.append((label, value))
+        self._max_value = max(self._max_value, value)
         self.update_table()
         self.update_chart()
         
@@ -180,24 +195,44 @@ class DataVisualizationTab(QWidget):
         )
         if reply == QMessageBox.StandardButton.Yes:
             self.data.clear()
+            self._max_value = 0
+            self._label_static.clear()
             self.update_table()
             self.update_chart()
             
     def update_table(self):
         """Update the data table"""
-        self.data_table.setRowCount(len(self.data))
-        for i, (label, value) in enumerate(self.data):
-            self.data_table.setItem(i, 0, QTableWidgetItem(label))
-            self.data_table.setItem(i, 1, QTableWidgetItem(str(value)))
+        # Data is only ever appended to or cleared, so existing rows are
+        # still correct and only the new points need items
+        first_new_row = min(self.data_table.rowCount(), len(self.data))
+        self.data_table.setUpdatesEnabled(False)
+        self.data_table.blockSignals(True)
+        try:
+            self.data_table.setRowCount(len(self.data))
+            for i in range(first_new_row, len(self.data)):
+                label, value = self.data[i]
+                self.data_table.setItem(i, 0, QTableWidgetItem(label))
+                self.data_table.setItem(i, 1, QTableWidgetItem(str(value)))
+        finally:
+            self.data_table.blockSignals(False)
+            self.data_table.setUpdatesEnabled(True)
             
     def update_chart(self):
         """Update the chart display"""
+        if not self.isVisible():
+            # Repaint when the tab is next shown instead
+            self._dirty = True
+            return
         if not self.data:
             self.chart_label.setText("Add some data to see the chart\n\nClick 'Add Random Data' or 'Add Custom Data' to get started")
             return
             
         chart_type = self.chart_type.currentText()
-        pixmap = QPixmap(680, 430)
+        
+        # Drop the label's reference first so painting reuses the buffer in
+        # place instead of detaching a fresh copy
+        self.chart_label.clear()
+        pixmap = self._chart_pixmap
         pixmap.fill(Qt.GlobalColor.white)
         
         painter = QPainter(pixmap)
@@ -219,27 +254,44 @@ class DataVisualizationTab(QWidget):
         painter.end()
         self.chart_label.setPixmap(pixmap)
         
+    def showEvent(self, event):
+        """Repaint a chart that changed while hidden"""
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.update_chart()
+            
+    def static_label(self, label):
+        """Get a cached QStaticText for an axis label"""
+        static = self._label_static.get(label)
+        if static is None:
+            static = self._label_static[label] = QStaticText(label)
+            # Labels are user input; never interpret them as rich text
+            static.setTextFormat(Qt.TextFormat.PlainText)
+        return static
+        
     def draw_bar_chart(self, painter, width, height):
         """Draw a bar chart"""
         margin = 60
         chart_width = width - 2 * margin
         chart_height = height - 2 * margin
         
-        max_value = max(value for _, value in self.data)
+        # Scale factor is loop-invariant, so compute it once
+        y_scale = chart_height / self._max_value
         bar_width = chart_width // len(self.data)
         
-        colors = [QColor("#FF6B6B"), QColor("#4ECDC4"), QColor("#45B7D1"), 
-                 QColor("#96CEB4"), QColor("#FFEAA7"), QColor("#DDA0DD"),
-                 QColor("#98D8C8"), QColor("#F7DC6F"), QColor("#BB8FCE")]
+        colors = self.CHART_COLORS
         
         # Draw title
         painter.setPen(QPen(Qt.GlobalColor.black))
         painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
         painter.drawText(width//2 - 50, 30, "Bar Chart")
         
-        # Draw bars
+        # Draw bars (title pen is reused for values and labels)
+        painter.setFont(QFont("Arial", 10))
+        ascent = painter.fontMetrics().ascent()
         for i, (label, value) in enumerate(self.data):
-            bar_height = (value / max_value) * chart_height
+            bar_height = value * y_scale
             x = margin + i * bar_width
             y = height - margin - bar_height
             
@@ -247,15 +299,13 @@ class DataVisualizationTab(QWidget):
             painter.fillRect(x + 5, y, bar_width - 10, bar_height, color)
             
             # Draw value on top of bar
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.setFont(QFont("Arial", 10))
             painter.drawText(x + bar_width//2 - 10, y - 5, str(value))
             
             # Draw label
             painter.save()
             painter.translate(x + bar_width//2, height - margin + 40)
             painter.rotate(-45)
-            painter.drawText(-len(label) * 3, 0, label)
+            painter.drawStaticText(-len(label) * 3, -ascent, self.static_label(label))
             painter.restore()
             
     def draw_line_chart(self, painter, width, height):
@@ -269,38 +319,42 @@ class DataVisualizationTab(QWidget):
             painter.drawText(width//2 - 100, height//2, "Need at least 2 data points for line chart")
             return
             
-        max_value = max(value for _, value in self.data)
+        x_step = chart_width / (len(self.data) - 1)
+        y_scale = chart_height / self._max_value
         points = []
         
-        # Draw title
+        # Draw title (title pen is reused for the axis labels)
         painter.setPen(QPen(Qt.GlobalColor.black))
         painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
         painter.drawText(width//2 - 50, 30, "Line Chart")
         
-        # Calculate points
-        for i, (_, value) in enumerate(self.data):
-            x = margin + (i / (len(self.data) - 1)) * chart_width
-            y = height - margin - (value / max_value) * chart_height
-            points.append((x, y))
-            
-        # Draw line
-        painter.setPen(QPen(QColor("#4ECDC4"), 3))
-        for i in range(len(points) - 1):
-            painter.drawLine(points[i][0], points[i][1], points[i+1][0], points[i+1][1])
-            
-        # Draw points and labels
-        painter.setPen(QPen(Qt.GlobalColor.black))
+        # Calculate points and draw the axis labels in a single pass; the
+        # labels sit below the chart area, so the line never covers them
         painter.setFont(QFont("Arial", 10))
-        for i, ((x, y), (label, value)) in enumerate(zip(points, self.data)):
-            painter.fillRect(x - 4, y - 4, 8, 8, QColor("#FF6B6B"))
-            painter.drawText(x - 10, y - 10, str(value))
+        ascent = painter.fontMetrics().ascent()
+        for i, (label, value) in enumerate(self.data):
+            x = margin + i * x_step
+            y = height - margin - value * y_scale
+            points.append(QPointF(x, y))
             
             # Draw label
             painter.save()
             painter.translate(x, height - margin + 40)
             painter.rotate(-45)
-            painter.drawText(-len(label) * 3, 0, label)
+            painter.drawStaticText(-len(label) * 3, -ascent, self.static_label(label))
             painter.restore()
+        polygon = QPolygonF(points)
+            
+        # Draw line and point markers, one native call each
+        painter.setPen(QPen(self.CHART_COLORS[1], 3))
+        painter.drawPolyline(polygon)
+        painter.setPen(QPen(self.CHART_COLORS[0], 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.SquareCap))
+        painter.drawPoints(polygon)
+        
+        # Draw values last so the line and markers never cover them
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        for point, (_, value) in zip(points, self.data):
+            painter.drawText(point.x() - 10, point.y() - 10, str(value))
             
     def draw_pie_chart(self, painter, width, height):
         """Draw a pie chart"""
@@ -310,9 +364,13 @@ class DataVisualizationTab(QWidget):
         
         total = sum(value for _, value in self.data)
         start_angle = 0
-        colors = [QColor("#FF6B6B"), QColor("#4ECDC4"), QColor("#45B7D1"), 
-                 QColor("#96CEB4"), QColor("#FFEAA7"), QColor("#DDA0DD"),
-                 QColor("#98D8C8"), QColor("#F7DC6F"), QColor("#BB8FCE")]
+        colors = self.CHART_COLORS
+        angle_scale = 360 * 16 / total  # Qt uses 1/16th degrees
+        percent_scale = 100 / total
+        label_radius = radius * 0.7
+        slice_pen = QPen(Qt.GlobalColor.white, 2)
+        percent_pen = QPen(Qt.GlobalColor.white)
+        percent_font = QFont("Arial", 10, QFont.Weight.Bold)
         
         # Draw title
         painter.setPen(QPen(Qt.GlobalColor.black))
@@ -321,36 +379,36 @@ class DataVisualizationTab(QWidget):
         
         # Draw pie slices
         for i, (label, value) in enumerate(self.data):
-            span_angle = int((value / total) * 360 * 16)  # Qt uses 1/16th degrees
+            span_angle = int(value * angle_scale)
             color = colors[i % len(colors)]
             painter.setBrush(color)
-            painter.setPen(QPen(Qt.GlobalColor.white, 2))
+            painter.setPen(slice_pen)
             painter.drawPie(center_x - radius, center_y - radius, 
                           radius * 2, radius * 2, start_angle, span_angle)
             
             # Draw percentage label
             mid_angle = (start_angle + span_angle // 2) / 16.0  # Convert back to degrees
             mid_angle_rad = math.radians(mid_angle)
-            label_x = center_x + (radius * 0.7) * math.cos(mid_angle_rad)
-            label_y = center_y + (radius * 0.7) * math.sin(mid_angle_rad)
+            label_x = center_x + label_radius * math.cos(mid_angle_rad)
+            label_y = center_y + label_radius * math.sin(mid_angle_rad)
             
-            percentage = (value / total) * 100
-            painter.setPen(QPen(Qt.GlobalColor.white))
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+            percentage = value * percent_scale
+            painter.setPen(percent_pen)
+            painter.setFont(percent_font)
             painter.drawText(label_x - 15, label_y, f"{percentage:.1f}%")
             
             start_angle += span_angle
             
         # Draw legend
         legend_y = height - 100
+        legend_x = 20
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        painter.setFont(QFont("Arial", 10))
         for i, (label, value) in enumerate(self.data):
             color = colors[i % len(colors)]
-            legend_x = 20
             legend_item_y = legend_y + i * 20
             
             painter.fillRect(legend_x, legend_item_y, 15, 15, color)
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.setFont(QFont("Arial", 10))
             painter.drawText(legend_x + 20, legend_item_y + 12, f"{label}: {value}")
             
     def draw_scatter_plot(self, painter, width, height):
@@ -359,7 +417,8 @@ class DataVisualizationTab(QWidget):
         chart_width = width - 2 * margin
         chart_height = height - 2 * margin
         
-        max_value = max(value for _, value in self.data)
+        x_step = chart_width / len(self.data)
+        y_scale = chart_height / self._max_value
         
         # Draw title
         painter.setPen(QPen(Qt.GlobalColor.black))
@@ -372,19 +431,17 @@ class DataVisualizationTab(QWidget):
         painter.drawLine(margin, margin, margin, height - margin)  # Y-axis
         
         # Draw points
-        colors = [QColor("#FF6B6B"), QColor("#4ECDC4"), QColor("#45B7D1"), 
-                 QColor("#96CEB4"), QColor("#FFEAA7")]
+        colors = self.SCATTER_COLORS
+        painter.setPen(QPen(Qt.GlobalColor.black, 1))
+        painter.setFont(QFont("Arial", 9))
         
         for i, (label, value) in enumerate(self.data):
-            x = margin + (i / len(self.data)) * chart_width
-            y = height - margin - (value / max_value) * chart_height
+            x = margin + i * x_step
+            y = height - margin - value * y_scale
             
             color = colors[i % len(colors)]
             painter.setBrush(color)
-            painter.setPen(QPen(Qt.GlobalColor.black, 1))
             painter.drawEllipse(x - 8, y - 8, 16, 16)
             
             # Draw label
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.setFont(QFont("Arial", 9))
             painter.drawText(x - len(label) * 3, y + 25, label)
\ No newline at end of file
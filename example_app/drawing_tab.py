@@ -4,8 +4,40 @@ Drawing Tab - Simple drawing canvas with brush tools
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QLabel, QSlider, QColorDialog, QFileDialog, QMessageBox)
-from PySide6.QtCore import Qt, QPoint
-from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
+from PySide6.QtCore import Qt, QPoint, QRect
+from PySide6.QtGui import QImage, QPixmap, QPainter, QPen, QColor
+
+
+class DrawingCanvas(QLabel):
+    """Label that paints a pixmap itself so strokes only repaint what changed"""
+    
+    def __init__(self, pixmap):
+        super().__init__()
+        self.canvas_pixmap = pixmap
+        
+    def set_canvas_pixmap(self, pixmap):
+        """Replace the displayed pixmap"""
+        self.canvas_pixmap = pixmap
+        self.update()
+        
+    def pixmap_origin(self):
+        """Widget position of the pixmap's top-left corner"""
+        return self.contentsRect().topLeft()
+        
+    def update_pixmap_rect(self, rect):
+        """Schedule a repaint of the given pixmap area only"""
+        self.update(rect.translated(self.pixmap_origin()))
+        
+    def paintEvent(self, event):
+        """Draw the border, then blit the dirty part of the pixmap"""
+        super().paintEvent(event)
+        origin = self.pixmap_origin()
+        target = event.rect() & QRect(origin, self.canvas_pixmap.size())
+        if target.isEmpty():
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(target, self.canvas_pixmap, target.translated(-origin))
+        painter.end()
 
 
 class DrawingTab(QWidget):
@@ -17,6 +49,10 @@ class DrawingTab(QWidget):
         self.brush_size = 3
         self.brush_color = Qt.GlobalColor.black
         self.last_point = QPoint()
+        # One pen and one painter are reused for a whole stroke
+        self._pen = QPen(self.brush_color, self.brush_size, Qt.PenStyle.SolidLine,
+                         Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+        self._painter = None
         self.init_ui()
         
     def init_ui(self):
@@ -88,16 +124,14 @@ class DrawingTab(QWidget):
         
         layout.addLayout(controls_layout)
         
-        # Drawing area
-        self.canvas = QLabel()
-        self.canvas.setMinimumSize(700, 500)
-        self.canvas.setStyleSheet("border: 2px solid #333; background-color: white;")
-        self.canvas.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
         # Initialize pixmap
         self.pixmap = QPixmap(700, 500)
         self.pixmap.fill(Qt.GlobalColor.white)
-        self.canvas.setPixmap(self.pixmap)
+        
+        # Drawing area
+        self.canvas = DrawingCanvas(self.pixmap)
+        self.canvas.setMinimumSize(700, 500)
+        self.canvas.setStyleSheet("border: 2px solid #333; background-color: white;")
         
         layout.addWidget(self.canvas)
         
@@ -112,6 +146,7 @@ class DrawingTab(QWidget):
     def change_brush_size(self, value):
         """Change the brush size"""
         self.brush_size = value
+        self._pen.setWidth(value)
         self.size_display.setText(str(value))
         
     def choose_color(self):
@@ -123,6 +158,7 @@ class DrawingTab(QWidget):
     def set_color(self, color):
         """Set the brush color"""
         self.brush_color = color
+        self._pen.setColor(color)
         self.color_btn.setStyleSheet(f"background-color: {color.name()}; color: white; font-weight: bold; padding: 8px;")
         
     def clear_canvas(self):
@@ -133,8 +169,9 @@ class DrawingTab(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
+            self.end_stroke()
             self.pixmap.fill(Qt.GlobalColor.white)
-            self.canvas.setPixmap(self.pixmap)
+            self.canvas.update()
             
     def save_image(self):
         """Save the drawing to a file"""
@@ -155,53 +192,73 @@ class DrawingTab(QWidget):
             "Image Files (*.png *.jpg *.jpeg *.gif *.bmp);;All Files (*)"
         )
         if file_path:
-            loaded_pixmap = QPixmap(file_path)
-            if not loaded_pixmap.isNull():
+            # Decode and scale as a QImage so only the canvas-sized result
+            # is ever uploaded as a pixmap
+            loaded_image = QImage(file_path)
+            if not loaded_image.isNull():
                 # Scale image to fit canvas
-                self.pixmap = loaded_pixmap.scaled(700, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                scaled_image = loaded_image.scaled(700, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                 # Center on white background
                 final_pixmap = QPixmap(700, 500)
                 final_pixmap.fill(Qt.GlobalColor.white)
                 painter = QPainter(final_pixmap)
-                x = (700 - self.pixmap.width()) // 2
-                y = (500 - self.pixmap.height()) // 2
-                painter.drawPixmap(x, y, self.pixmap)
+                x = (700 - scaled_image.width()) // 2
+                y = (500 - scaled_image.height()) // 2
+                painter.drawImage(x, y, scaled_image)
                 painter.end()
                 self.pixmap = final_pixmap
-                self.canvas.setPixmap(self.pixmap)
+                self.canvas.set_canvas_pixmap(self.pixmap)
             else:
                 QMessageBox.warning(self, "Error", "Failed to load image")
         
+    def map_to_pixmap(self, event):
+        """Convert a mouse event position to pixmap coordinates"""
+        canvas_pos = self.canvas.mapFromGlobal(event.globalPosition().toPoint())
+        return canvas_pos - self.canvas.pixmap_origin()
+        
     def mousePressEvent(self, event):
         """Handle mouse press events for drawing"""
         if event.button() == Qt.MouseButton.LeftButton:
-            # Convert global coordinates to canvas coordinates
-            canvas_pos = self.canvas.mapFromGlobal(event.globalPosition().toPoint())
-            if self.canvas.rect().contains(canvas_pos):
+            # A stroke whose release never arrived must not keep its painter
+            self.end_stroke()
+            canvas_pos = self.map_to_pixmap(event)
+            if self.pixmap.rect().contains(canvas_pos):
                 self.drawing = True
                 self.last_point = canvas_pos
+                self._painter = QPainter(self.pixmap)
+                self._painter.setPen(self._pen)
                 
     def mouseMoveEvent(self, event):
         """Handle mouse move events for drawing"""
         if event.buttons() & Qt.MouseButton.LeftButton and self.drawing:
-            # Convert global coordinates to canvas coordinates
-            canvas_pos = self.canvas.mapFromGlobal(event.globalPosition().toPoint())
-            if self.canvas.rect().contains(canvas_pos):
+            canvas_pos = self.map_to_pixmap(event)
+            if self.pixmap.rect().contains(canvas_pos):
                 current_point = canvas_pos
                 
-                painter = QPainter(self.pixmap)
-                painter.setPen(QPen(self.brush_color, self.brush_size, 
-                                  Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
-                
                 if not self.last_point.isNull():
-                    painter.drawLine(self.last_point, current_point)
-                    
-                painter.end()
+                    self._painter.drawLine(self.last_point, current_point)
+                
+                # Repaint only the segment's bounding box, padded by the brush
+                dirty = QRect(self.last_point, current_point).normalized()
+                dirty = dirty.adjusted(-self.brush_size, -self.brush_size,
+                                       self.brush_size, self.brush_size)
+                self.canvas.update_pixmap_rect(dirty)
                 self.last_point = current_point
-                self.canvas.setPixmap(self.pixmap)
                 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.drawing = False
-            self.last_point = QPoint()
\ No newline at end of file
+            self.end_stroke()
+            
+    def hideEvent(self, event):
+        """Finish any stroke in progress; its release may never arrive"""
+        self.end_stroke()
+        super().hideEvent(event)
+        
+    def end_stroke(self):
+        """Stop drawing and release the stroke's painter on the pixmap"""
+        self.drawing = False
+        self.last_point = QPoint()
+        if self._painter is not None:
+            self._painter.end()
+            self._painter = None
\ No newline at end of file
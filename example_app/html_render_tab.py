@@ -5,134 +5,30 @@ HTML Render Tab - HTML and CSS rendering with live preview
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QLabel, QSplitter, QPlainTextEdit, QFileDialog,
                                QMessageBox, QTextBrowser)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
-# Try to import QWebEngineView for better HTML rendering
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-    WEB_ENGINE_AVAILABLE = True
-except ImportError:
-    WEB_ENGINE_AVAILABLE = False
+# QWebEngineView gives better HTML rendering, but loading QtWebEngine is
+# expensive, so it is only imported once this tab is actually built. As
+# that happens after the QApplication exists, applications must set
+# Qt.ApplicationAttribute.AA_ShareOpenGLContexts before creating it
+WEB_ENGINE_AVAILABLE = None
+QWebEngineView = None
 
 
-class HTMLRenderTab(QWidget):
-    """HTML rendering tab with live preview"""
-    
-    def __init__(self):
-        super().__init__()
-        self.init_ui()
-        
-    def init_ui(self):
-        """Initialize the HTML renderer interface"""
-        layout = QVBoxLayout()
-        
-        # Controls
-        controls_layout = QHBoxLayout()
-        
-        load_btn = QPushButton("Load HTML File")
-        load_btn.clicked.connect(self.load_html_file)
-        load_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold; padding: 8px;")
-        
-        save_btn = QPushButton("Save HTML File")
-        save_btn.clicked.connect(self.save_html_file)
-        save_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 8px;")
-        
-        reload_btn = QPushButton("Reload Preview")
-        reload_btn.clicked.connect(self.reload_content)
-        reload_btn.setStyleSheet("background-color: #ff9800; color: white; font-weight: bold; padding: 8px;")
-        
-        sample_btn = QPushButton("Load Sample HTML")
-        sample_btn.clicked.connect(self.load_sample_html)
-        sample_btn.setStyleSheet("background-color: #9c27b0; color: white; font-weight: bold; padding: 8px;")
-        
-        clear_btn = QPushButton("Clear")
-        clear_btn.clicked.connect(self.clear_content)
-        clear_btn.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; padding: 8px;")
-        
-        controls_layout.addWidget(load_btn)
-        controls_layout.addWidget(save_btn)
-        controls_layout.addWidget(reload_btn)
-        controls_layout.addWidget(sample_btn)
-        controls_layout.addWidget(clear_btn)
-        controls_layout.addStretch()
-        
-        layout.addLayout(controls_layout)
-        
-        # Engine info
-        if not WEB_ENGINE_AVAILABLE:
-            info_label = QLabel("⚠️ QWebEngineView not available. Using QTextBrowser for basic HTML rendering.")
-            info_label.setStyleSheet("color: #ff9800; background-color: #fff3cd; padding: 8px; border-radius: 4px;")
-            layout.addWidget(info_label)
-        
-        # Splitter for HTML input and rendered output
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # HTML input area
-        input_widget = QWidget()
-        input_layout = QVBoxLayout()
-        
-        input_header = QLabel("HTML + CSS Code:")
-        input_header.setStyleSheet("font-weight: bold; font-size: 14px; margin-bottom: 5px;")
-        input_layout.addWidget(input_header)
-        
-        self.html_input = QPlainTextEdit()
-        self.html_input.setPlainText(self.get_sample_html())
-        self.html_input.textChanged.connect(self.update_preview)
-        self.html_input.setStyleSheet("""
-            QPlainTextEdit {
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                line-height: 1.4;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }
-        """)
-        
-        input_layout.addWidget(self.html_input)
-        input_widget.setLayout(input_layout)
-        
-        # Preview area
-        preview_widget = QWidget()
-        preview_layout = QVBoxLayout()
-        
-        preview_header = QLabel("Live Preview:")
-        preview_header.setStyleSheet("font-weight: bold; font-size: 14px; margin-bottom: 5px;")
-        preview_layout.addWidget(preview_header)
-        
-        # Choose appropriate rendering widget
-        if WEB_ENGINE_AVAILABLE:
-            self.web_view = QWebEngineView()
-        else:
-            # Fallback to QTextBrowser if WebEngine is not available
-            self.web_view = QTextBrowser()
-            
-        self.web_view.setStyleSheet("border: 1px solid #ddd; border-radius: 4px;")
-        preview_layout.addWidget(self.web_view)
-        preview_widget.setLayout(preview_layout)
-        
-        splitter.addWidget(input_widget)
-        splitter.addWidget(preview_widget)
-        splitter.setSizes([400, 400])
-        
-        layout.addWidget(splitter)
-        
-        # Instructions
-        instructions = QLabel("""
-Instructions: Edit the HTML/CSS code on the left to see live preview on the right. 
-Load sample HTML to see advanced CSS features, or start with your own code.
-        """.strip())
-        instructions.setStyleSheet("color: #666; font-style: italic; padding: 10px; background-color: #f9f9f9; border-radius: 4px;")
-        instructions.setWordWrap(True)
-        layout.addWidget(instructions)
-        
-        self.setLayout(layout)
-        
-        # Initial load
-        self.update_preview()
-        
-    def get_sample_html(self):
-        """Get sample HTML with modern CSS features"""
-        return """<!DOCTYPE html>
+def load_web_engine():
+    """Try to import QWebEngineView on first use and report availability"""
+    global WEB_ENGINE_AVAILABLE, QWebEngineView
+    if WEB_ENGINE_AVAILABLE is None:
+        try:
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+            WEB_ENGINE_AVAILABLE = True
+        except ImportError:
+            WEB_ENGINE_AVAILABLE = False
+    return WEB_ENGINE_AVAILABLE
+
+
+# Demo page shown on startup and by 'Load Sample HTML'
+SAMPLE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -317,15 +213,159 @@ Load sample HTML to see advanced CSS features, or start with your own code.
     </div>
 </body>
 </html>"""
+
+
+class HTMLRenderTab(QWidget):
+    """HTML rendering tab with live preview"""
+    
+    def __init__(self):
+        super().__init__()
+        self._last_rendered_html = None
+        self._dirty = False
+        
+        # Re-render only after typing pauses, not on every keystroke
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(250)
+        self._preview_timer.timeout.connect(self.update_preview)
+        
+        self.init_ui()
+        
+    def init_ui(self):
+        """Initialize the HTML renderer interface"""
+        layout = QVBoxLayout()
+        
+        # Controls
+        controls_layout = QHBoxLayout()
+        
+        load_btn = QPushButton("Load HTML File")
+        load_btn.clicked.connect(self.load_html_file)
+        load_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold; padding: 8px;")
+        
+        save_btn = QPushButton("Save HTML File")
+        save_btn.clicked.connect(self.save_html_file)
+        save_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 8px;")
+        
+        reload_btn = QPushButton("Reload Preview")
+        reload_btn.clicked.connect(self.reload_content)
+        reload_btn.setStyleSheet("background-color: #ff9800; color: white; font-weight: bold; padding: 8px;")
+        
+        sample_btn = QPushButton("Load Sample HTML")
+        sample_btn.clicked.connect(self.load_sample_html)
+        sample_btn.setStyleSheet("background-color: #9c27b0; color: white; font-weight: bold; padding: 8px;")
+        
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear_content)
+        clear_btn.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; padding: 8px;")
+        
+        controls_layout.addWidget(load_btn)
+        controls_layout.addWidget(save_btn)
+        controls_layout.addWidget(reload_btn)
+        controls_layout.addWidget(sample_btn)
+        controls_layout.addWidget(clear_btn)
+        controls_layout.addStretch()
+        
+        layout.addLayout(controls_layout)
+        
+        # Engine info
+        if not load_web_engine():
+            info_label = QLabel("⚠️ QWebEngineView not available. Using QTextBrowser for basic HTML rendering.")
+            info_label.setStyleSheet("color: #ff9800; background-color: #fff3cd; padding: 8px; border-radius: 4px;")
+            layout.addWidget(info_label)
+        
+        # Splitter for HTML input and rendered output
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        # HTML input area
+        input_widget = QWidget()
+        input_layout = QVBoxLayout()
+        
+        input_header = QLabel("HTML + CSS Code:")
+        input_header.setStyleSheet("font-weight: bold; font-size: 14px; margin-bottom: 5px;")
+        input_layout.addWidget(input_header)
+        
+        self.html_input = QPlainTextEdit()
+        self.html_input.setPlainText(self.get_sample_html())
+        self.html_input.textChanged.connect(self._preview_timer.start)
+        self.html_input.setStyleSheet("""
+            QPlainTextEdit {
+                font-family: 'Courier New', monospace;
+                font-size: 12px;
+                line-height: 1.4;
+                border: 1px solid #ddd;
+                border-radius: 4px;
+            }
+        """)
+        
+        input_layout.addWidget(self.html_input)
+        input_widget.setLayout(input_layout)
+        
+        # Preview area
+        preview_widget = QWidget()
+        preview_layout = QVBoxLayout()
+        
+        preview_header = QLabel("Live Preview:")
+        preview_header.setStyleSheet("font-weight: bold; font-size: 14px; margin-bottom: 5px;")
+        preview_layout.addWidget(preview_header)
+        
+        # Choose appropriate rendering widget
+        if WEB_ENGINE_AVAILABLE:
+            self.web_view = QWebEngineView()
+        else:
+            # Fallback to QTextBrowser if WebEngine is not available
+            self.web_view = QTextBrowser()
+            
+        self.web_view.setStyleSheet("border: 1px solid #ddd; border-radius: 4px;")
+        preview_layout.addWidget(self.web_view)
+        preview_widget.setLayout(preview_layout)
+        
+        splitter.addWidget(input_widget)
+        splitter.addWidget(preview_widget)
+        splitter.setSizes([400, 400])
+        
+        layout.addWidget(splitter)
+        
+        # Instructions
+        instructions = QLabel("""
+Instructions: Edit the HTML/CSS code on the left to see live preview on the right. 
+Load sample HTML to see advanced CSS features, or start with your own code.
+        """.strip())
+        instructions.setStyleSheet("color: #666; font-style: italic; padding: 10px; background-color: #f9f9f9; border-radius: 4px;")
+        instructions.setWordWrap(True)
+        layout.addWidget(instructions)
+        
+        self.setLayout(layout)
+        
+        # Initial load
+        self.update_preview()
+        
+    def get_sample_html(self):
+        """Get sample HTML with modern CSS features"""
+        return SAMPLE_HTML
         
     def update_preview(self):
         """Update the preview with current HTML content"""
+        self._preview_timer.stop()
+        if not self.isVisible():
+            # Render when the tab is next shown instead
+            self._dirty = True
+            return
         html_content = self.html_input.toPlainText()
+        if html_content == self._last_rendered_html:
+            return
         try:
             self.web_view.setHtml(html_content)
+            self._last_rendered_html = html_content
         except Exception as e:
             print(f"Error updating preview: {e}")
             
+    def showEvent(self, event):
+        """Render any preview update that arrived while hidden"""
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.update_preview()
+            
     def load_html_file(self):
         """Load HTML content from a file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -357,6 +397,7 @@ Load sample HTML to see advanced CSS features, or start with your own code.
                 
     def reload_content(self):
         """Reload the preview content"""
+        self._last_rendered_html = None
         self.update_preview()
         QMessageBox.information(self, "Reloaded", "Preview has been reloaded.")
         
@@ -4,21 +4,58 @@ Image Viewer Tab - Drag and drop image viewer with zoom controls
 
 import os
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                               QLabel, QScrollArea, QFileDialog, QMessageBox,
-                               QSlider, QSpinBox, QGroupBox, QComboBox)
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QDragEnterEvent, QDropEvent, QTransform
+                               QLabel, QFileDialog, QMessageBox, QGraphicsScene,
+                               QGraphicsView, QSlider, QSpinBox, QGroupBox, QComboBox)
+from PySide6.QtCore import Qt, QSize, QRectF, QTimer, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPixmap, QPainter, QDragEnterEvent, QDropEvent, QTransform
+
+
+class ImageLoaderSignals(QObject):
+    """Signals for ImageLoader; QRunnable itself cannot emit signals"""
+    loaded = Signal(QImage, str)
+
+
+class ImageLoader(QRunnable):
+    """Background task that decodes an image file into a QImage"""
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = ImageLoaderSignals()
+    
+    def run(self):
+        # QImage is safe to use off the GUI thread, unlike QPixmap
+        self.signals.loaded.emit(QImage(self.file_path), self.file_path)
 
 
 class ImageViewerTab(QWidget):
     """Image viewer with drag and drop, zoom, and rotation features"""
     
+    # Images with a longer edge than this are displayed from a downsampled
+    # copy until the zoom level needs the full resolution
+    MAX_DISPLAY_EDGE = 4096
+    
+    IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.svg'})
+    
     def __init__(self):
         super().__init__()
         self.current_image = None
         self.original_pixmap = None
         self.scale_factor = 1.0
         self.rotation_angle = 0
+        self.pixmap_item = None
+        self._display_pixmap = None
+        self._downsample_ratio = 1.0
+        self._showing_full = None
+        self._loading_path = None
+        
+        # Coalesce bursts of zoom/rotate requests into one display update
+        # once the event queue drains
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(0)
+        self._display_timer.timeout.connect(self.update_image_display)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -104,8 +141,8 @@ class ImageViewerTab(QWidget):
         
         layout.addLayout(info_layout)
         
-        # Image display area
-        self.scroll_area = QScrollArea()
+        # Image display area; the placeholder label is shown until an image
+        # is loaded, then the graphics view takes its place
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setStyleSheet("""
@@ -118,12 +155,21 @@ class ImageViewerTab(QWidget):
             }
         """)
         self.image_label.setText("🖼️\n\nDrag and drop an image here\nor click 'Open Image' to browse\n\nSupported formats: PNG, JPG, JPEG, GIF, BMP, TIFF")
-        
-        self.scroll_area.setWidget(self.image_label)
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("QScrollArea { border: 1px solid #ddd; }")
-        
-        layout.addWidget(self.scroll_area)
+        layout.addWidget(self.image_label)
+        
+        # Zoom and rotation are applied as a view transform at paint time,
+        # so only the visible part of the image is ever resampled
+        self.scene = QGraphicsScene(self)
+        self.view = QGraphicsView(self.scene)
+        self.view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.view.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.view.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
+        self.view.setStyleSheet("QGraphicsView { border: 1px solid #ddd; background-color: white; }")
+        # Let file drops reach this tab instead of the scene
+        self.view.setAcceptDrops(False)
+        self.view.viewport().setAcceptDrops(False)
+        self.view.hide()
+        layout.addWidget(self.view)
         
         # Status bar
         self.status_label = QLabel("Ready - Drop an image or use 'Open Image'")
@@ -176,30 +222,66 @@ class ImageViewerTab(QWidget):
                 
     def is_image_file(self, file_path):
         """Check if file is a supported image format"""
-        return file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.svg'))
+        # Only the suffix is lowercased, then a single set lookup
+        return os.path.splitext(file_path)[1].lower() in self.IMAGE_EXTENSIONS
             
     def open_image(self):
         """Open image file dialog"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Open Image", "", 
-            "Image Files (*.png *.jpg *.jpeg *.gif *.bmp *.tiff *.svg);;All Files (*)"
+            "Image Files (*.png *.jpg *.jpeg *.gif *.bmp *.tiff *.svg);;All Files (*)",
+            # Skip probing every directory for a custom icon, slow on network mounts
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons
         )
         if file_path:
             self.load_image(file_path)
             
     def load_image(self, file_path):
-        """Load image from file path"""
+        """Decode an image file in the background, then display it"""
+        self._loading_path = file_path
+        self.status_label.setText(f"Loading {os.path.basename(file_path)}...")
+        loader = ImageLoader(file_path)
+        loader.signals.loaded.connect(self.on_image_loaded)
+        QThreadPool.globalInstance().start(loader)
+        
+    def on_image_loaded(self, image, file_path):
+        """Show an image decoded by ImageLoader"""
+        if file_path != self._loading_path:
+            return  # A newer load superseded this one
+        self._loading_path = None
         try:
-            self.original_pixmap = QPixmap(file_path)
-            if self.original_pixmap.isNull():
+            if image.isNull():
+                self.status_label.setText("Ready - Drop an image or use 'Open Image'")
                 QMessageBox.warning(self, "Error", "Could not load image file. The file may be corrupted or in an unsupported format.")
                 return
+            # Keep the decoded format rather than converting per pixel
+            self.original_pixmap = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
                 
             self.current_image = file_path
+            file_name = os.path.basename(file_path)
             self.scale_factor = 1.0
             self.rotation_angle = 0
             
+            # Downsample huge images once so painting samples fewer pixels
+            long_edge = max(self.original_pixmap.width(), self.original_pixmap.height())
+            if long_edge > self.MAX_DISPLAY_EDGE:
+                self._display_pixmap = self.original_pixmap.scaled(
+                    self.MAX_DISPLAY_EDGE, self.MAX_DISPLAY_EDGE,
+                    Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                self._downsample_ratio = self._display_pixmap.width() / self.original_pixmap.width()
+            else:
+                self._display_pixmap = self.original_pixmap
+                self._downsample_ratio = 1.0
+            
             # Update image display
+            if self.pixmap_item is None:
+                self.pixmap_item = self.scene.addPixmap(self._display_pixmap)
+                self.pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+            self._showing_full = None  # Force the new image onto the item
+            self.set_display_source(False)
+            self.scene.setSceneRect(QRectF(self.original_pixmap.rect()))
+            self.image_label.hide()
+            self.view.show()
             self.update_image_display()
             
             # Update info
@@ -207,14 +289,14 @@ class ImageViewerTab(QWidget):
             file_size_str = self.format_file_size(file_size)
             
             self.image_info_label.setText(
-                f"{os.path.basename(file_path)} | "
+                f"{file_name} | "
                 f"{self.original_pixmap.width()}×{self.original_pixmap.height()} | "
                 f"{file_size_str}"
             )
-            self.status_label.setText(f"Loaded: {os.path.basename(file_path)}")
+            self.status_label.setText(f"Loaded: {file_name}")
             
             # Reset zoom slider
-            self.zoom_slider.setValue(100)
+            self.set_zoom_slider(100)
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not load image: {str(e)}")
@@ -233,46 +315,50 @@ class ImageViewerTab(QWidget):
         if not self.original_pixmap:
             return
             
-        # Apply rotation
+        # Switch to the full-resolution pixmap only when zoomed in past
+        # what the downsampled copy can show
+        self.set_display_source(self.scale_factor > self._downsample_ratio)
+        
         transform = QTransform()
+        transform.scale(self.scale_factor, self.scale_factor)
         transform.rotate(self.rotation_angle)
-        rotated_pixmap = self.original_pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-        
-        # Apply scaling
-        if self.scale_factor != 1.0:
-            new_size = rotated_pixmap.size() * self.scale_factor
-            scaled_pixmap = rotated_pixmap.scaled(new_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        else:
-            scaled_pixmap = rotated_pixmap
-            
-        self.image_label.setPixmap(scaled_pixmap)
-        self.image_label.resize(scaled_pixmap.size())
+        self.view.setTransform(transform)
         
         # Update zoom label
         zoom_percent = int(self.scale_factor * 100)
         self.zoom_label.setText(f"{zoom_percent}%")
         
-        # Update image label style for loaded image
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: none;
-                background-color: white;
-            }
-        """)
+    def set_display_source(self, full):
+        """Show the original or the downsampled pixmap at original scene size"""
+        if full == self._showing_full:
+            return
+        if full or self._display_pixmap is self.original_pixmap:
+            self.pixmap_item.setPixmap(self.original_pixmap)
+            self.pixmap_item.setScale(1.0)
+        else:
+            self.pixmap_item.setPixmap(self._display_pixmap)
+            self.pixmap_item.setScale(1.0 / self._downsample_ratio)
+        self._showing_full = full
+        
+    def set_zoom_slider(self, value):
+        """Move the zoom slider without re-triggering a rescale"""
+        self.zoom_slider.blockSignals(True)
+        self.zoom_slider.setValue(value)
+        self.zoom_slider.blockSignals(False)
             
     def zoom_in(self):
         """Zoom in by 25%"""
         if self.original_pixmap:
             self.scale_factor *= 1.25
-            self.update_image_display()
-            self.zoom_slider.setValue(int(self.scale_factor * 100))
+            self._display_timer.start()
+            self.set_zoom_slider(int(self.scale_factor * 100))
             
     def zoom_out(self):
         """Zoom out by 25%"""
         if self.original_pixmap:
             self.scale_factor /= 1.25
-            self.update_image_display()
-            self.zoom_slider.setValue(int(self.scale_factor * 100))
+            self._display_timer.start()
+            self.set_zoom_slider(int(self.scale_factor * 100))
             
     def fit_to_window(self):
         """Fit image to window size"""
@@ -280,46 +366,45 @@ class ImageViewerTab(QWidget):
             return
             
         # Get available space
-        available_size = self.scroll_area.size()
+        available_size = self.view.viewport().size()
         
         # Account for rotation
-        transform = QTransform()
-        transform.rotate(self.rotation_angle)
-        rotated_pixmap = self.original_pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-        image_size = rotated_pixmap.size()
+        image_size = self.original_pixmap.size()
+        if self.rotation_angle in (90, 270):
+            image_size.transpose()
         
         # Calculate scale factor to fit
         scale_x = (available_size.width() - 20) / image_size.width()  # 20px margin
         scale_y = (available_size.height() - 20) / image_size.height()
         self.scale_factor = min(scale_x, scale_y)
         
-        self.update_image_display()
-        self.zoom_slider.setValue(int(self.scale_factor * 100))
+        self._display_timer.start()
+        self.set_zoom_slider(int(self.scale_factor * 100))
         
     def actual_size(self):
         """Show image at actual size (100%)"""
         if self.original_pixmap:
             self.scale_factor = 1.0
-            self.update_image_display()
-            self.zoom_slider.setValue(100)
+            self._display_timer.start()
+            self.set_zoom_slider(100)
             
     def rotate_left(self):
         """Rotate image 90 degrees counter-clockwise"""
         if self.original_pixmap:
             self.rotation_angle = (self.rotation_angle - 90) % 360
-            self.update_image_display()
+            self._display_timer.start()
             
     def rotate_right(self):
         """Rotate image 90 degrees clockwise"""
         if self.original_pixmap:
             self.rotation_angle = (self.rotation_angle + 90) % 360
-            self.update_image_display()
+            self._display_timer.start()
             
     def slider_zoom_changed(self, value):
         """Handle zoom slider changes"""
         if self.original_pixmap:
             self.scale_factor = value / 100.0
-            self.update_image_display()
+            self._display_timer.start()
             
     def save_image(self):
         """Save current image with transformations"""
@@ -333,9 +418,10 @@ class ImageViewerTab(QWidget):
         )
         if file_path:
             try:
-                # Get current transformed pixmap
-                current_pixmap = self.image_label.pixmap()
-                if current_pixmap and current_pixmap.save(file_path):
+                # Render the current transformation into a new pixmap
+                current_pixmap = self.original_pixmap.transformed(
+                    self.view.transform(), Qt.TransformationMode.SmoothTransformation)
+                if current_pixmap.save(file_path):
                     QMessageBox.information(self, "Success", f"Image saved to {file_path}")
                 else:
                     QMessageBox.warning(self, "Error", "Failed to save image")
@@ -359,7 +445,13 @@ class ImageViewerTab(QWidget):
             self.scale_factor = 1.0
             self.rotation_angle = 0
             
-            self.image_label.clear()
+            self.scene.removeItem(self.pixmap_item)
+            self.pixmap_item = None
+            self._display_pixmap = None
+            self._downsample_ratio = 1.0
+            self.view.resetTransform()
+            self.view.hide()
+            self.image_label.show()
             self.image_label.setText("🖼️\n\nDrag and drop an image here\nor click 'Open Image' to browse\n\nSupported formats: PNG, JPG, JPEG, GIF, BMP, TIFF")
             self.image_label.setStyleSheet("""
                 QLabel {
@@ -373,5 +465,5 @@ class ImageViewerTab(QWidget):
             
             self.image_info_label.setText("No image loaded")
             self.status_label.setText("Ready - Drop an image or use 'Open Image'")
-            self.zoom_slider.setValue(100)
+            self.set_zoom_slider(100)
             self.zoom_label.setText("100%")
\ No newline at end of file
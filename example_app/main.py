@@ -59,50 +59,70 @@ class MultiTabApp(QMainWindow):
 
         # Connect tab change signal
         self.tab_widget.currentChanged.connect(self.tab_changed)
+        self.load_tab(self.tab_widget.currentIndex())
 
     def add_tabs(self):
         """Add all tabs to the tab widget"""
         tabs = [
-            (CalculatorTab(), "Calculator"),
-            (TodoTab(), "Todo List"),
-            (DrawingTab(), "Drawing"),
-            (DataVisualizationTab(), "Charts"),
-            (SettingsTab(), "Settings"),
-            (HTMLRenderTab(), "HTML Renderer"),
-            (TextEditorTab(), "Text Editor"),
-            (ImageViewerTab(), "Image Viewer"),
-            (MediaPlayerTab(), "Media Player"),
-            (NotificationTab(), "Notifications"),
-            (MonacoEditorWidget(), "Monaco Editor"),
+            (CalculatorTab, "Calculator"),
+            (TodoTab, "Todo List"),
+            (DrawingTab, "Drawing"),
+            (DataVisualizationTab, "Charts"),
+            (SettingsTab, "Settings"),
+            (HTMLRenderTab, "HTML Renderer"),
+            (TextEditorTab, "Text Editor"),
+            (ImageViewerTab, "Image Viewer"),
+            (MediaPlayerTab, "Media Player"),
+            (NotificationTab, "Notifications"),
+            (MonacoEditorWidget, "Monaco Editor"),
         ]
 
-        for tab_widget, tab_name in tabs:
-            self.tab_widget.addTab(tab_widget, tab_name)
+        # Tabs start as empty placeholders and are built on first visit
+        self._tab_factories = {}
+        for tab_class, tab_name in tabs:
+            self._tab_factories[tab_name] = tab_class
+            self.tab_widget.addTab(QWidget(), tab_name)
+
+    def load_tab(self, index):
+        """Replace the placeholder at index with its real tab, if not done yet"""
+        tab_name = self.tab_widget.tabText(index)
+        tab_class = self._tab_factories.get(tab_name)
+        if tab_class is None:
+            return
+
+        # Build the tab before touching the tab widget, so a failing
+        # constructor leaves the placeholder and factory in place
+        tab = tab_class()
+        del self._tab_factories[tab_name]
+
+        placeholder = self.tab_widget.widget(index)
+        # Swapping the page would otherwise re-enter tab_changed
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, tab_name)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
 
     def tab_changed(self, index):
         """Handle tab change events"""
-        tab_names = [
-            "Calculator",
-            "Todo List",
-            "Drawing",
-            "Charts",
-            "Settings",
-            "HTML Renderer",
-            "Text Editor",
-            "Image Viewer",
-            "Media Player",
-            "Notifications",
-            "Monaco Editor",
-        ]
-        if index < len(tab_names):
-            self.statusBar().showMessage(f"Current tab: {tab_names[index]}")
+        self.load_tab(index)
+        self.statusBar().showMessage(f"Current tab: {self.tab_widget.tabText(index)}")
 
 
 def main():
     """Main application entry point"""
+    # QtWebEngine is imported lazily by the HTML and Monaco tabs, after the
+    # application exists, so it needs shared GL contexts requested up front
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setApplicationName("PySide6 Multi-Tab Example")
 
+    # Start reading Monaco's scripts while the window is built
+    MonacoEditorWidget.preload()
+
     # Create and show the main window
     window = MultiTabApp()
     window.show()
@@ -8,20 +8,32 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QGroupBox, QComboBox, QSpinBox)
 from PySide6.QtCore import Qt, QUrl, QTimer
 
-# Try to import multimedia components
-try:
-    from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-    from PySide6.QtMultimediaWidgets import QVideoWidget
-    MULTIMEDIA_AVAILABLE = True
-except ImportError:
-    MULTIMEDIA_AVAILABLE = False
+# Multimedia components are imported when the tab is first built, so the
+# audio/video backends are not loaded at application startup
+MULTIMEDIA_AVAILABLE = None
+QMediaPlayer = QAudioOutput = QVideoWidget = None
+
+
+def load_multimedia():
+    """Try to import the multimedia classes on first use and report availability"""
+    global MULTIMEDIA_AVAILABLE, QMediaPlayer, QAudioOutput, QVideoWidget
+    if MULTIMEDIA_AVAILABLE is None:
+        try:
+            from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+            from PySide6.QtMultimediaWidgets import QVideoWidget
+            MULTIMEDIA_AVAILABLE = True
+        except ImportError:
+            MULTIMEDIA_AVAILABLE = False
+    return MULTIMEDIA_AVAILABLE
 
 
 class MediaPlayerTab(QWidget):
     """File chooser and media player"""
     def __init__(self):
         super().__init__()
-        if MULTIMEDIA_AVAILABLE:
+        self.file_name = ""
+        self._last_slider_px = -1
+        if load_multimedia():
             self.media_player = QMediaPlayer()
             self.audio_output = QAudioOutput()
             self.media_player.setAudioOutput(self.audio_output)
@@ -95,6 +107,7 @@ class MediaPlayerTab(QWidget):
         self.media_player.positionChanged.connect(self.position_changed)
         self.media_player.durationChanged.connect(self.duration_changed)
         self.media_player.playbackStateChanged.connect(self.state_changed)
+        self.media_player.mediaStatusChanged.connect(self.media_status_changed)
         
         # Set initial volume
         self.set_volume(50)
@@ -102,18 +115,27 @@ class MediaPlayerTab(QWidget):
     def choose_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Choose Media File", "",
-            "Media Files (*.mp4 *.avi *.mov *.mp3 *.wav *.flac *.ogg);;All Files (*)"
+            "Media Files (*.mp4 *.avi *.mov *.mp3 *.wav *.flac *.ogg);;All Files (*)",
+            # Skip probing every directory for a custom icon, slow on network mounts
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons
         )
         if file_path:
             self.load_file(file_path)
             
     def load_file(self, file_path):
         try:
+            # Play is enabled by media_status_changed once the media is ready
+            self.play_btn.setEnabled(False)
+            self.file_name = os.path.basename(file_path)
             self.media_player.setSource(QUrl.fromLocalFile(file_path))
-            self.file_label.setText(f"File: {os.path.basename(file_path)}")
-            self.play_btn.setEnabled(True)
+            # Re-selecting the current source emits no status change, so
+            # enable Play directly if the media is already loaded
+            if self.media_player.mediaStatus() in (QMediaPlayer.MediaStatus.LoadedMedia,
+                                                   QMediaPlayer.MediaStatus.BufferedMedia):
+                self.play_btn.setEnabled(True)
+                self.status_label.setText(f"Loaded: {self.file_name}")
+            self.file_label.setText(f"File: {self.file_name}")
             self.stop_btn.setEnabled(True)
-            self.status_label.setText(f"Loaded: {os.path.basename(file_path)}")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not load media file: {str(e)}")
             
@@ -133,11 +155,36 @@ class MediaPlayerTab(QWidget):
         self.media_player.setPosition(position)
         
     def position_changed(self, position):
+        # positionChanged fires many times a second; only move the slider
+        # when the handle would land on a different pixel
+        if self.position_slider.isSliderDown():
+            return
+        duration = self.media_player.duration()
+        px = position * self.position_slider.width() // duration if duration > 0 else 0
+        if px == self._last_slider_px:
+            return
+        self._last_slider_px = px
         self.position_slider.setValue(position)
         
     def duration_changed(self, duration):
+        self._last_slider_px = -1
         self.position_slider.setRange(0, duration)
         
+    def media_status_changed(self, status):
+        if status == QMediaPlayer.MediaStatus.LoadingMedia:
+            self.status_label.setText("Loading...")
+        elif status == QMediaPlayer.MediaStatus.LoadedMedia:
+            self.play_btn.setEnabled(True)
+            self.status_label.setText(f"Loaded: {self.file_name}")
+        elif status == QMediaPlayer.MediaStatus.BufferedMedia:
+            self.play_btn.setEnabled(True)
+        elif status == QMediaPlayer.MediaStatus.StalledMedia:
+            self.status_label.setText("Buffering...")
+        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
+            self.play_btn.setEnabled(False)
+            self.stop_btn.setEnabled(False)
+            self.status_label.setText("Could not play this file")
+            
     def state_changed(self, state):
         if state == QMediaPlayer.PlaybackState.PlayingState:
             self.play_btn.setText("Pause")
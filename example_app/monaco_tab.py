@@ -8,153 +8,52 @@ Usage:
     widget = MonacoEditorWidget()
     widget.set_content("print('Hello World')")
     widget.set_language("python")
+
+QtWebEngine is only imported once an editor is first shown, after the
+QApplication exists, so applications must call
+QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+before creating their QApplication.
 """
 
 import os
+import json
 from pathlib import Path
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QMessageBox
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtCore import QUrl, QObject, Slot, Signal
-from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox
+from PySide6.QtCore import Qt, QUrl, QObject, QTimer, QRunnable, QThreadPool, Slot, Signal
+# QtWebEngine and QtWebChannel are imported where they are first used, so
+# importing this module (e.g. for preload()) does not start Chromium
 
 
-class MonacoInterface(QObject):
-    """Interface between Python and Monaco Editor JavaScript"""
-    
-    content_changed = Signal(str)
-    editor_ready = Signal()
-    
-    def __init__(self):
-        super().__init__()
-        self.current_content = ""
-        self._editor_ready = False
-    
-    @Slot(str)
-    def update_content(self, content):
-        """Called from JavaScript when editor content changes"""
-        self.current_content = content
-        self.content_changed.emit(content)
-    
-    @Slot()
-    def editor_initialized(self):
-        """Called from JavaScript when editor is ready"""
-        self._editor_ready = True
-        self.editor_ready.emit()
-    
-    @property
-    def is_ready(self):
-        """Check if the editor is ready to receive commands"""
-        return self._editor_ready
+# File extension to Monaco language identifier
+LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.html': 'html',
+    '.htm': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.md': 'markdown',
+    '.sql': 'sql',
+    '.cpp': 'cpp',
+    '.c': 'cpp',
+    '.h': 'cpp',
+    '.java': 'java',
+    '.cs': 'csharp',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.txt': 'plaintext'
+}
 
 
-class MonacoEditorWidget(QWidget):
-    """
-    A reusable Monaco Editor widget for PySide6 applications.
-    
-    Signals:
-        content_changed(str): Emitted when the editor content changes
-        editor_ready(): Emitted when the editor is fully loaded and ready
-    
-    Example:
-        editor = MonacoEditorWidget()
-        editor.content_changed.connect(lambda text: print(f"Content: {text}"))
-        editor.set_language("python")
-        editor.set_content("def hello():\n    print('Hello World')")
-    """
-    
-    # Expose signals from the interface
-    content_changed = Signal(str)
-    editor_ready = Signal()
-    
-    def __init__(self, parent=None, monaco_path=None):
-        """
-        Initialize the Monaco Editor widget.
-        
-        Args:
-            parent: Parent widget
-            monaco_path: Path to monaco-editor folder (auto-detected if None)
-        """
-        super().__init__(parent)
-        
-        # Find Monaco Editor path
-        if monaco_path:
-            self.monaco_path = Path(monaco_path)
-        else:
-            # Look for monaco-editor in same directory as this file
-            self.monaco_path = Path(__file__).parent / "monaco-editor"
-        
-        # Verify Monaco Editor exists
-        if not self._verify_monaco_installation():
-            return
-        
-        # Create the Monaco interface
-        self.monaco_interface = MonacoInterface()
-        
-        # Connect signals
-        self.monaco_interface.content_changed.connect(self.content_changed.emit)
-        self.monaco_interface.editor_ready.connect(self.editor_ready.emit)
-        
-        # Set up the widget
-        self._setup_ui()
-        self._create_monaco_html()
-    
-    def _verify_monaco_installation(self):
-        """Verify that Monaco Editor is properly installed"""
-        if not self.monaco_path.exists():
-            self._show_setup_error("Monaco Editor folder not found", 
-                                 f"Expected location: {self.monaco_path}")
-            return False
-        
-        loader_path = self.monaco_path / "min" / "vs" / "loader.js"
-        if not loader_path.exists():
-            self._show_setup_error("Monaco Editor files incomplete", 
-                                 f"Missing: {loader_path}")
-            return False
-        
-        return True
-    
-    def _show_setup_error(self, title, message):
-        """Show setup error message"""
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Icon.Critical)
-        msg.setWindowTitle(title)
-        msg.setText("Monaco Editor setup required!")
-        msg.setInformativeText(
-            f"{message}\n\n"
-            "To fix this:\n"
-            "1. Download Monaco Editor from: https://github.com/microsoft/monaco-editor/releases\n"
-            "2. Extract to 'monaco-editor' folder\n"
-            "3. Ensure structure: monaco-editor/min/vs/loader.js"
-        )
-        msg.exec()
-    
-    def _setup_ui(self):
-        """Set up the widget UI"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Web view for Monaco Editor
-        self.web_view = QWebEngineView()
-        layout.addWidget(self.web_view)
-    
-    def _create_monaco_html(self):
-        """Create and load the Monaco Editor HTML"""
-        html_file = self._create_html_file()
-        
-        # Set up web channel
-        self.web_channel = QWebChannel()
-        self.web_channel.registerObject("monaco_interface", self.monaco_interface)
-        self.web_view.page().setWebChannel(self.web_channel)
-        
-        # Load the HTML file
-        self.web_view.load(QUrl.fromLocalFile(str(html_file.resolve())))
-    
-    def _create_html_file(self):
-        """Create the HTML file for Monaco Editor"""
-        html_file = Path(__file__).parent / "monaco_editor_widget.html"
-        monaco_abs_path = self.monaco_path.resolve().as_posix()
-        
-        html_content = f'''<!DOCTYPE html>
+# Editor page, formatted with the Monaco path when the HTML file is written
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -350,10 +249,274 @@ class MonacoEditorWidget(QWidget):
     </script>
 </body>
 </html>'''
+
+
+class MonacoPreloadTask(QRunnable):
+    """Background task that reads Monaco's main scripts into the OS page cache"""
+    
+    def __init__(self, monaco_path):
+        super().__init__()
+        self.files = [
+            monaco_path / "min" / "vs" / "loader.js",
+            monaco_path / "min" / "vs" / "editor" / "editor.main.js",
+        ]
+    
+    def run(self):
+        for path in self.files:
+            try:
+                with open(path, 'rb') as f:
+                    while f.read(1024 * 1024):
+                        pass
+            except OSError:
+                pass  # Preloading is best effort
+
+
+class MonacoInterface(QObject):
+    """Interface between Python and Monaco Editor JavaScript"""
+    
+    content_changed = Signal(str)
+    editor_ready = Signal()
+    
+    def __init__(self):
+        super().__init__()
+        self.current_content = ""
+        self._editor_ready = False
+        
+        # Coalesce bursts of edits into one content_changed per interval
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(50)
+        self._emit_timer.timeout.connect(self._emit_content)
+    
+    @Slot(str)
+    def update_content(self, content):
+        """Called from JavaScript when editor content changes"""
+        self.current_content = content
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+    
+    def _emit_content(self):
+        """Emit content_changed with the latest editor content"""
+        self.content_changed.emit(self.current_content)
+    
+    def flush(self):
+        """Emit any pending content_changed signal immediately"""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._emit_content()
+    
+    @Slot()
+    def editor_initialized(self):
+        """Called from JavaScript when editor is ready"""
+        self._editor_ready = True
+        self.editor_ready.emit()
+    
+    @property
+    def is_ready(self):
+        """Check if the editor is ready to receive commands"""
+        return self._editor_ready
+
+
+class MonacoEditorWidget(QWidget):
+    """
+    A reusable Monaco Editor widget for PySide6 applications.
+    
+    Signals:
+        content_changed(str): Emitted when the editor content changes
+        editor_ready(): Emitted when the editor is fully loaded and ready
+    
+    Example:
+        editor = MonacoEditorWidget()
+        editor.content_changed.connect(lambda text: print(f"Content: {text}"))
+        editor.set_language("python")
+        editor.set_content("def hello():\n    print('Hello World')")
+    """
+    
+    # Expose signals from the interface
+    content_changed = Signal(str)
+    editor_ready = Signal()
+    
+    # The editor page is written once and shared by all editor instances
+    _html_monaco_path = None
+    
+    # Monaco install folders that have already passed verification
+    _verified_paths = set()
+    
+    def __init__(self, parent=None, monaco_path=None):
+        """
+        Initialize the Monaco Editor widget.
+        
+        Args:
+            parent: Parent widget
+            monaco_path: Path to monaco-editor folder (auto-detected if None)
+        """
+        super().__init__(parent)
+        
+        # Find Monaco Editor path
+        if monaco_path:
+            self.monaco_path = Path(monaco_path)
+        else:
+            # Look for monaco-editor in same directory as this file
+            self.monaco_path = Path(__file__).parent / "monaco-editor"
+        
+        # Monaco itself is only loaded once the widget is first shown
+        self._monaco_pending = False
+        
+        # Verify Monaco Editor exists
+        if not self._verify_monaco_installation():
+            return
+        
+        # Create the Monaco interface
+        self.monaco_interface = MonacoInterface()
+        
+        # Connect signals
+        self.monaco_interface.content_changed.connect(self.content_changed.emit)
+        self.monaco_interface.editor_ready.connect(self.editor_ready.emit)
+        self.monaco_interface.editor_ready.connect(self._flush_js)
+        
+        # Editor API calls are batched into one runJavaScript per event loop pass
+        self._pending_js = []
+        self._flush_scheduled = False
+        
+        # Last state sent to the editor, used to skip no-op updates
+        self._last_content = ""
+        self._last_language = None
+        self._last_theme = None
+        self._last_options = {}
+        
+        # Set up the widget (the web view is created on first show)
+        self._setup_ui()
+        self._monaco_pending = True
+    
+    def _verify_monaco_installation(self):
+        """Verify that Monaco Editor is properly installed"""
+        if self.monaco_path in MonacoEditorWidget._verified_paths:
+            return True
+        
+        # loader.js existing implies the folder exists, so one stat suffices
+        loader_path = self.monaco_path / "min" / "vs" / "loader.js"
+        if loader_path.exists():
+            MonacoEditorWidget._verified_paths.add(self.monaco_path)
+            return True
+        
+        if not self.monaco_path.exists():
+            self._show_setup_error("Monaco Editor folder not found", 
+                                 f"Expected location: {self.monaco_path}")
+        else:
+            self._show_setup_error("Monaco Editor files incomplete", 
+                                 f"Missing: {loader_path}")
+        return False
+    
+    def _show_setup_error(self, title, message):
+        """Show setup error message"""
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Icon.Critical)
+        msg.setWindowTitle(title)
+        msg.setText("Monaco Editor setup required!")
+        msg.setInformativeText(
+            f"{message}\n\n"
+            "To fix this:\n"
+            "1. Download Monaco Editor from: https://github.com/microsoft/monaco-editor/releases\n"
+            "2. Extract to 'monaco-editor' folder\n"
+            "3. Ensure structure: monaco-editor/min/vs/loader.js"
+        )
+        msg.exec()
+    
+    def _setup_ui(self):
+        """Set up the widget UI"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Lightweight placeholder until Monaco is needed
+        self._placeholder = QLabel("Loading Monaco Editor...")
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._placeholder)
+    
+    def _ensure_monaco(self):
+        """Create the web view and start loading Monaco on first use"""
+        if not self._monaco_pending:
+            return
+        self._monaco_pending = False
+        
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+        
+        # Web view for Monaco Editor
+        self.web_view = QWebEngineView()
+        self.layout().replaceWidget(self._placeholder, self.web_view)
+        self._placeholder.deleteLater()
+        self._placeholder = None
+        
+        self._create_monaco_html()
+    
+    def _run_js(self, script):
+        """Queue JavaScript for the editor page, loading Monaco if needed"""
+        self._ensure_monaco()
+        self._pending_js.append(script)
+        if self.monaco_interface.is_ready and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_js)
+    
+    def _flush_js(self):
+        """Send all queued JavaScript to the editor in a single call"""
+        self._flush_scheduled = False
+        if not self._pending_js:
+            return
+        # Isolate each call so one throwing statement cannot drop the rest
+        script = "\n".join(
+            f"try {{\n{js}\n}} catch (e) {{ console.error(e); }}"
+            for js in self._pending_js
+        )
+        self._pending_js.clear()
+        self.web_view.page().runJavaScript(script)
+    
+    def showEvent(self, event):
+        """Load Monaco the first time the widget becomes visible"""
+        self._ensure_monaco()
+        super().showEvent(event)
+    
+    @staticmethod
+    def preload(monaco_path=None):
+        """
+        Warm the OS file cache with Monaco's scripts on a background thread.
+        
+        Call once at application start so the first editor loads faster.
+        
+        Args:
+            monaco_path: Path to monaco-editor folder (auto-detected if None)
+        """
+        if monaco_path is None:
+            monaco_path = Path(__file__).parent / "monaco-editor"
+        QThreadPool.globalInstance().start(MonacoPreloadTask(Path(monaco_path)))
+    
+    def _create_monaco_html(self):
+        """Create and load the Monaco Editor HTML"""
+        html_file = self._create_html_file()
+        
+        from PySide6.QtWebChannel import QWebChannel
+        
+        # Set up web channel
+        self.web_channel = QWebChannel()
+        self.web_channel.registerObject("monaco_interface", self.monaco_interface)
+        self.web_view.page().setWebChannel(self.web_channel)
+        
+        # Load the HTML file
+        self.web_view.load(QUrl.fromLocalFile(str(html_file.resolve())))
+    
+    def _create_html_file(self):
+        """Create the HTML file for Monaco Editor"""
+        html_file = Path(__file__).parent / "monaco_editor_widget.html"
+        monaco_abs_path = self.monaco_path.resolve().as_posix()
+        
+        # The page is shared, so only write it when the Monaco path changes
+        if MonacoEditorWidget._html_monaco_path == monaco_abs_path:
+            return html_file
+        
+        html_content = _HTML_TEMPLATE.format(monaco_abs_path=monaco_abs_path)
         
         # Write HTML file
         with open(html_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
+        MonacoEditorWidget._html_monaco_path = monaco_abs_path
         
         return html_file
     
@@ -369,9 +532,13 @@ class MonacoEditorWidget(QWidget):
         if content is None:
             content = ""
         
-        # Escape content for JavaScript
-        escaped_content = content.replace('\\', '\\\\').replace('`', '\\`').replace('$', '\\$')
-        self.web_view.page().runJavaScript(f"setEditorContent(`{escaped_content}`);")
+        # Skip if the editor already shows this text
+        if content == self._last_content and content == self.monaco_interface.current_content:
+            return
+        self._last_content = content
+        
+        # json.dumps produces a valid JavaScript string literal in one pass
+        self._run_js(f"setEditorContent({json.dumps(content)});")
     
     def get_content(self):
         """
@@ -389,7 +556,10 @@ class MonacoEditorWidget(QWidget):
         Args:
             language (str): Language identifier (e.g., 'python', 'javascript', 'html')
         """
-        self.web_view.page().runJavaScript(f"setEditorLanguage('{language}');")
+        if language == self._last_language:
+            return
+        self._last_language = language
+        self._run_js(f"setEditorLanguage({json.dumps(language)});")
     
     def set_theme(self, theme):
         """
@@ -398,15 +568,18 @@ class MonacoEditorWidget(QWidget):
         Args:
             theme (str): Theme name ('vs', 'vs-dark', 'hc-black')
         """
-        self.web_view.page().runJavaScript(f"setEditorTheme('{theme}');")
+        if theme == self._last_theme:
+            return
+        self._last_theme = theme
+        self._run_js(f"setEditorTheme({json.dumps(theme)});")
     
     def format_document(self):
         """Format the entire document using Monaco's formatter."""
-        self.web_view.page().runJavaScript("formatDocument();")
+        self._run_js("formatDocument();")
     
     def focus(self):
         """Focus the editor."""
-        self.web_view.page().runJavaScript("focusEditor();")
+        self._run_js("focusEditor();")
     
     def insert_text(self, text):
         """
@@ -415,8 +588,7 @@ class MonacoEditorWidget(QWidget):
         Args:
             text (str): Text to insert
         """
-        escaped_text = text.replace('\\', '\\\\').replace("'", "\\'")
-        self.web_view.page().runJavaScript(f"insertText('{escaped_text}');")
+        self._run_js(f"insertText({json.dumps(text)});")
     
     def set_editor_options(self, **options):
         """
@@ -425,9 +597,15 @@ class MonacoEditorWidget(QWidget):
         Args:
             **options: Monaco editor options (fontSize, wordWrap, etc.)
         """
-        import json
+        # Only send options whose values actually changed
+        options = {key: value for key, value in options.items()
+                   if key not in self._last_options or self._last_options[key] != value}
+        if not options:
+            return
+        self._last_options.update(options)
+        
         options_json = json.dumps(options)
-        self.web_view.page().runJavaScript(f"setEditorOptions({options_json});")
+        self._run_js(f"setEditorOptions({options_json});")
     
     def is_ready(self):
         """
@@ -446,44 +624,18 @@ class MonacoEditorWidget(QWidget):
             filename (str): Filename to detect language from
         """
         ext = Path(filename).suffix.lower()
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.html': 'html',
-            '.htm': 'html',
-            '.css': 'css',
-            '.scss': 'scss',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.md': 'markdown',
-            '.sql': 'sql',
-            '.cpp': 'cpp',
-            '.c': 'cpp',
-            '.h': 'cpp',
-            '.java': 'java',
-            '.cs': 'csharp',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.txt': 'plaintext'
-        }
-        
-        language = language_map.get(ext, 'plaintext')
+        language = LANGUAGE_MAP.get(ext, 'plaintext')
         self.set_language(language)
         return language
     
     def cleanup(self):
         """Clean up temporary files (call when widget is destroyed)"""
         html_file = Path(__file__).parent / "monaco_editor_widget.html"
-        if html_file.exists():
-            try:
-                html_file.unlink()
-            except:
-                pass  # Ignore cleanup errors
+        MonacoEditorWidget._html_monaco_path = None
+        try:
+            html_file.unlink(missing_ok=True)
+        except OSError:
+            pass  # Ignore cleanup errors
     
     def closeEvent(self, event):
         """Handle widget close event"""
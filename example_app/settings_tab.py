@@ -14,6 +14,7 @@ class SettingsTab(QWidget):
     """Settings and preferences tab"""
     def __init__(self):
         super().__init__()
+        self._info_box = None
         self.init_ui()
         
     def init_ui(self):
@@ -94,7 +95,7 @@ class SettingsTab(QWidget):
         ok, font = QFontDialog.getFont()
         if ok:
             self.setFont(font)
-            QMessageBox.information(self, "Font Selected", f"Selected font: {font.family()}, Size: {font.pointSize()}")
+            self.show_info("Font Selected", f"Selected font: {font.family()}, Size: {font.pointSize()}")
             
     def apply_settings(self):
         theme = "Light" if self.theme_group.checkedId() == 0 else "Dark"
@@ -110,7 +111,7 @@ Auto-save: {auto_save}
 Notifications: {notifications}
 Sound Effects: {sound}"""
         
-        QMessageBox.information(self, "Settings Applied", settings_text)
+        self.show_info("Settings Applied", settings_text)
         
     def reset_settings(self):
         self.theme_group.button(0).setChecked(True)
@@ -118,4 +119,14 @@ Sound Effects: {sound}"""
         self.auto_save_check.setChecked(True)
         self.notifications_check.setChecked(True)
         self.sound_check.setChecked(False)
-        QMessageBox.information(self, "Settings Reset", "All settings have been reset to default values.")
+        self.show_info("Settings Reset", "All settings have been reset to default values.")
+        
+    def show_info(self, title, text):
+        """Show an information dialog, reusing one message box for the tab"""
+        if self._info_box is None:
+            self._info_box = QMessageBox(QMessageBox.Icon.Information, title, text,
+                                         QMessageBox.StandardButton.Ok, self)
+        else:
+            self._info_box.setWindowTitle(title)
+            self._info_box.setText(text)
+        self._info_box.exec()
@@ -10,6 +10,7 @@ class TextEditorTab(QWidget):
     def __init__(self):
         super().__init__()
         self.current_file = None
+        self.file_name = None
         self.init_ui()
         
     def init_ui(self):
@@ -78,7 +79,7 @@ class TextEditorTab(QWidget):
                 return
                 
         self.text_edit.clear()
-        self.current_file = None
+        self.set_current_file(None)
         self.status_label.setText("New document")
         
     def open_file(self):
@@ -90,8 +91,8 @@ class TextEditorTab(QWidget):
                 with open(file_path, 'r', encoding='utf-8') as file:
                     content = file.read()
                     self.text_edit.setPlainText(content)
-                    self.current_file = file_path
-                    self.status_label.setText(f"Opened: {os.path.basename(file_path)}")
+                    self.set_current_file(file_path)
+                    self.status_label.setText(f"Opened: {self.file_name}")
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not open file: {str(e)}")
                 
@@ -107,7 +108,13 @@ class TextEditorTab(QWidget):
         )
         if file_path:
             self.save_to_file(file_path)
-            self.current_file = file_path
+            self.set_current_file(file_path)
+            
+    def set_current_file(self, file_path):
+        """Remember the open file and its display name"""
+        self.current_file = file_path
+        # Computed once here rather than on every keystroke in text_changed
+        self.file_name = os.path.basename(file_path) if file_path else None
             
     def save_to_file(self, file_path):
         try:
@@ -129,8 +136,8 @@ class TextEditorTab(QWidget):
         self.text_edit.setFont(font)
         
     def text_changed(self):
-        if self.current_file:
-            status = f"Modified: {os.path.basename(self.current_file)}"
+        if self.file_name:
+            status = f"Modified: {self.file_name}"
         else:
             status = "Modified"
         self.status_label.setText(status)
\ No newline at end of file
@@ -3,13 +3,17 @@ Todo Tab - Simple todo list with add, complete, and delete functionality
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                               QLineEdit, QListWidget, QMessageBox)
+                               QLineEdit, QListWidget, QListWidgetItem, QMessageBox)
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
 
 
 class TodoTab(QWidget):
     """Todo list tab with task management functionality"""
     
+    COMPLETED_COLOR = QColor("#4CAF50")
+    PENDING_COLOR = QColor("black")
+    
     def __init__(self):
         super().__init__()
         self.init_ui()
@@ -55,6 +59,7 @@ class TodoTab(QWidget):
                 background-color: #e3f2fd;
             }
         """)
+        self.todo_list.itemChanged.connect(self.update_item_style)
         layout.addWidget(self.todo_list)
         
         # Action buttons
@@ -91,20 +96,28 @@ class TodoTab(QWidget):
     def add_sample_tasks(self):
         """Add some sample tasks for demonstration"""
         sample_tasks = [
-            "☐ Welcome to the Todo List!",
-            "☐ Click 'Toggle Complete' to mark tasks as done",
-            "☐ Add your own tasks using the input field above",
-            "✓ This task is already completed"
+            ("Welcome to the Todo List!", False),
+            ("Click 'Toggle Complete' to mark tasks as done", False),
+            ("Add your own tasks using the input field above", False),
+            ("This task is already completed", True)
         ]
         
-        for task in sample_tasks:
-            self.todo_list.addItem(task)
+        for task, completed in sample_tasks:
+            self.add_task_item(task, completed)
+            
+    def add_task_item(self, text, completed=False):
+        """Append a checkable task item to the list"""
+        item = QListWidgetItem(text)
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+        item.setCheckState(Qt.CheckState.Checked if completed else Qt.CheckState.Unchecked)
+        self.todo_list.addItem(item)
+        self.update_item_style(item)
         
     def add_todo(self):
         """Add a new todo item"""
         text = self.todo_input.text().strip()
         if text:
-            self.todo_list.addItem(f"☐ {text}")
+            self.add_task_item(text)
             self.todo_input.clear()
             self.todo_input.setFocus()  # Keep focus on input field
         else:
@@ -114,19 +127,24 @@ class TodoTab(QWidget):
         """Toggle completion status of selected task"""
         current_item = self.todo_list.currentItem()
         if current_item:
-            text = current_item.text()
-            if text.startswith("☐"):
-                # Mark as complete
-                new_text = text.replace("☐", "✓")
-                current_item.setText(new_text)
-                current_item.setStyleSheet("color: #4CAF50; text-decoration: line-through;")
-            elif text.startswith("✓"):
-                # Mark as incomplete
-                new_text = text.replace("✓", "☐")
-                current_item.setText(new_text)
-                current_item.setStyleSheet("color: black; text-decoration: none;")
+            # itemChanged restyles the item
+            if current_item.checkState() == Qt.CheckState.Checked:
+                current_item.setCheckState(Qt.CheckState.Unchecked)
+            else:
+                current_item.setCheckState(Qt.CheckState.Checked)
         else:
             QMessageBox.information(self, "No Selection", "Please select a task to toggle.")
+            
+    def update_item_style(self, item):
+        """Strike out and recolor an item to match its check state"""
+        completed = item.checkState() == Qt.CheckState.Checked
+        font = item.font()
+        font.setStrikeOut(completed)
+        # Styling the item would emit itemChanged and re-enter this slot
+        self.todo_list.blockSignals(True)
+        item.setFont(font)
+        item.setForeground(self.COMPLETED_COLOR if completed else self.PENDING_COLOR)
+        self.todo_list.blockSignals(False)
                 
     def delete_task(self):
         """Delete the selected task"""
@@ -154,20 +172,24 @@ class TodoTab(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.todo_list.clear()
+            # Clear in one go without per-item signals or repaints
+            self.todo_list.setUpdatesEnabled(False)
+            self.todo_list.blockSignals(True)
+            try:
+                self.todo_list.clear()
+            finally:
+                self.todo_list.blockSignals(False)
+                self.todo_list.setUpdatesEnabled(True)
             
     def show_statistics(self):
         """Show task statistics"""
         total_tasks = self.todo_list.count()
         completed_tasks = 0
-        incomplete_tasks = 0
         
         for i in range(total_tasks):
-            item = self.todo_list.item(i)
-            if item.text().startswith("✓"):
+            if self.todo_list.item(i).checkState() == Qt.CheckState.Checked:
                 completed_tasks += 1
-            elif item.text().startswith("☐"):
-                incomplete_tasks += 1
+        incomplete_tasks = total_tasks - completed_tasks
                 
         if total_tasks > 0:
             completion_rate = (completed_tasks / total_tasks) * 100
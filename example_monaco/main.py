@@ -7,6 +7,7 @@ import os
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                                QHBoxLayout, QWidget, QPushButton, 
                                QFileDialog, QMessageBox, QComboBox, QLabel)
+from PySide6.QtCore import Qt
 
 # Import the Monaco Editor Widget
 from monaco_widget import MonacoEditorWidget
@@ -158,8 +159,14 @@ class MonacoEditorApp(QMainWindow):
 
 
 def main():
+    # The editor imports QtWebEngine lazily, after the application exists,
+    # so it needs shared GL contexts requested up front
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     
+    # Start reading Monaco's scripts while the window is built
+    MonacoEditorWidget.preload()
+    
     window = MonacoEditorApp()
     window.show()
     